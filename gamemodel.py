@@ -9,9 +9,17 @@ PLAYER_0_COLOR = "blue"
 PLAYER_1_COLOR = "red"
 STARTING_AIM = (45, 40)
 WIND_SELECTION_RANGE = 10
+GRAVITY = 9.8
+HALF_GRAVITY = GRAVITY / 2.0
+
+# Aim angles are usually whole degrees, so their sine/cosine is looked up
+_SIN = [sin(radians(i)) for i in range(360)]
+_COS = [cos(radians(i)) for i in range(360)]
 
 
 class Projectile:
+    __slots__ = ("wind", "y_pos", "x_pos", "x_lower", "x_upper", "xvel", "yvel")
+
     def __init__(
         self,
         angle: float,
@@ -28,9 +36,16 @@ class Projectile:
         self.x_lower = x_lower
         self.x_upper = x_upper
 
-        theta = radians(angle)
-        self.xvel = velocity * cos(theta)
-        self.yvel = velocity * sin(theta)
+        # NaN isn't a whole number, so it takes the trig path rather than
+        # failing in int()
+        if angle % 1 == 0:
+            degrees = int(angle) % 360
+            self.xvel = velocity * _COS[degrees]
+            self.yvel = velocity * _SIN[degrees]
+        else:
+            theta = radians(angle)
+            self.xvel = velocity * cos(theta)
+            self.yvel = velocity * sin(theta)
 
     def update(
         self,
@@ -39,25 +54,76 @@ class Projectile:
         drag_y: float = 1.0,
         ignore_x_limits: bool = False,
     ) -> None:
-        # Compute new velocity based on acceleration from gravity/wind
-        yvel1 = self.yvel - 9.8 * time
-        xvel1 = self.xvel + self.wind * time
+        # Work on locals and write the state back once at the end
+        xvel = self.xvel
+        yvel = self.yvel
+        wind = self.wind
 
-        # Move based on the average velocity in the time period
-        self.x_pos = self.x_pos + time * (self.xvel + xvel1) / 2.0
-        self.y_pos = self.y_pos + time * (self.yvel + yvel1) / 2.0
+        # Acceleration from gravity/wind is constant during the step, so
+        # moving by the average velocity is the same as x += v*t + a*t*t/2
+        x_pos = self.x_pos + time * (xvel + 0.5 * wind * time)
+        y_pos = self.y_pos + time * (yvel - HALF_GRAVITY * time)
 
         # make sure yPos >= 0
-        self.y_pos = max(self.y_pos, 0)
+        if y_pos < 0.0:
+            y_pos = 0.0
 
         if not ignore_x_limits:
             # Make sure xLower <= xPos <= mUpper
-            self.x_pos = max(self.x_pos, self.x_lower)
-            self.x_pos = min(self.x_pos, self.x_upper)
+            if x_pos < self.x_lower:
+                x_pos = self.x_lower
+            elif x_pos > self.x_upper:
+                x_pos = self.x_upper
+
+        self.x_pos = x_pos
+        self.y_pos = y_pos
 
         # Update velocities
-        self.xvel = xvel1 * drag_x
-        self.yvel = yvel1 * drag_y
+        self.xvel = (xvel + wind * time) * drag_x
+        self.yvel = (yvel - GRAVITY * time) * drag_y
+
+    def simulate(self, time: float, xs: list[float], ys: list[float]) -> int:
+        # Gravity and wind are constant, so the position after each step is
+        # computed in closed form from the launch state. The positions after
+        # every step of `time` until the projectile stops are written to the
+        # start of xs/ys, which grow when too short, and their count returned.
+        # Leaves the projectile in its final state.
+        if not self.isMoving():
+            return 0
+
+        x_start, y_start = self.x_pos, self.y_pos
+        xvel, yvel = self.xvel, self.yvel
+        half_wind = self.wind / 2.0
+        x_lower, x_upper = self.x_lower, self.x_upper
+        size = len(xs)
+
+        step = 0
+        while True:
+            t = (step + 1) * time
+            x = x_start + t * (xvel + half_wind * t)
+            y = y_start + t * (yvel - HALF_GRAVITY * t)
+            if y < 0.0:
+                y = 0.0
+            if x < x_lower:
+                x = x_lower
+            elif x > x_upper:
+                x = x_upper
+            if step < size:
+                xs[step] = x
+                ys[step] = y
+            else:
+                xs.append(x)
+                ys.append(y)
+            step += 1
+            if not (0 < y and x_lower < x < x_upper):
+                break
+
+        self.x_pos = x
+        self.y_pos = y
+        self.xvel = xvel + self.wind * t
+        self.yvel = yvel - GRAVITY * t
+
+        return step
 
     def isMoving(self) -> bool:
         return 0 < self.getY() and self.x_lower < self.getX() < self.x_upper
@@ -74,9 +140,11 @@ class Player:
         self, game: "Game", is_reversed: bool, size: int, x_pos: float, color: str
     ):
         self.game = game
-        self.is_reversed = is_reversed
-        self.size = size
-        self.pos = (x_pos, self.size / 2.0)
+        # Reversed players fire to the left, mirroring the x velocity
+        self.x_sign = -1.0 if is_reversed else 1.0
+        self.half_size = size / 2.0
+        self.x = x_pos
+        self.y = self.half_size
         self.color = color
 
         self.score = 0
@@ -84,27 +152,28 @@ class Player:
 
     def fire(self, angle: float, velocity: float) -> Projectile:
         projectile = Projectile(
-            angle=180 - angle if self.is_reversed else angle,
+            angle=angle,
             velocity=velocity,
             wind=self.game.wind,
-            x_pos=self.pos[0],
-            y_pos=self.pos[1],
+            x_pos=self.x,
+            y_pos=self.y,
             x_lower=X_LOWER,
             x_upper=X_UPPER,
         )
+        projectile.xvel *= self.x_sign
 
         self.aim = (angle, velocity)
 
         return projectile
 
     def projectileDistance(self, proj: Projectile) -> float:
-        proj_half_size = self.game.getProjectileRadius()
-        cannon_half_size = self.size / 2.0
+        proj_half_size = self.game.projectile_radius
+        cannon_half_size = self.half_size
 
         total_overlap_size = cannon_half_size + proj_half_size
 
-        cannon_center = self.pos[0]
-        proj_center = proj.getX()
+        cannon_center = self.x
+        proj_center = proj.x_pos
 
         raw_distance = proj_center - cannon_center
 
@@ -113,16 +182,21 @@ class Player:
 
         return raw_distance - total_overlap_size * (1 if raw_distance > 0 else -1)
 
-    def collisionCheck(self, proj: Projectile) -> float:
-        circle_distance_x = abs(proj.getX() - self.pos[0])
-        circle_distance_y = abs(proj.getY() - self.pos[1])
+    def collisionCheck(self, proj: Projectile) -> bool:
+        projectile_r = self.game.projectile_radius
+        half_size = self.half_size
+        threshold = half_size + projectile_r
 
-        projectile_r = self.game.getProjectileRadius()
-        half_size = self.size / 2.0
-        if circle_distance_x > (half_size + projectile_r) or circle_distance_y > (
-            half_size + projectile_r
-        ):
+        # Reject on the signed distances first, the projectile is usually far away
+        dx = proj.x_pos - self.x
+        if dx > threshold or dx < -threshold:
             return False
+        dy = proj.y_pos - self.y
+        if dy > threshold or dy < -threshold:
+            return False
+
+        circle_distance_x = abs(dx)
+        circle_distance_y = abs(dy)
 
         if circle_distance_x <= half_size or circle_distance_y <= half_size:
             return True
@@ -134,10 +208,10 @@ class Player:
         return corner_distance_sq <= (projectile_r**2)
 
     def closestPoint(self, x: float, y: float) -> tuple[float, float]:
-        half_size = self.size / 2.0
+        half_size = self.half_size
         return (
-            max(self.pos[0] - half_size, min(x, self.pos[0] + half_size)),
-            max(self.pos[1] - half_size, min(y, self.pos[1] + half_size)),
+            max(self.x - half_size, min(x, self.x + half_size)),
+            max(self.y - half_size, min(y, self.y + half_size)),
         )
 
     def increaseScore(self, n: int = 1) -> None:
@@ -150,10 +224,10 @@ class Player:
         return self.color
 
     def getX(self) -> float:
-        return self.pos[0]
+        return self.x
 
     def getY(self) -> float:
-        return self.pos[1]
+        return self.y
 
     def getAim(self) -> tuple[float, float]:
         return self.aim
@@ -187,15 +261,15 @@ class Game:
         return self.players[self.current_player]
 
     def getOtherPlayer(self) -> Player:
-        return self.players[1] if self.current_player == 0 else self.players[0]
+        return self.players[self.current_player ^ 1]
 
     def getCurrentPlayerNumber(self) -> int:
         return self.current_player
 
     def nextPlayer(self) -> None:
-        self.current_player = 0 if self.current_player == 1 else 1
+        self.current_player ^= 1
 
-    def setCurrentWind(self, wind) -> None:
+    def setCurrentWind(self, wind: float) -> None:
         self.wind = wind
 
     def getCurrentWind(self) -> float:
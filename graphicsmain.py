@@ -1,11 +1,24 @@
 from enum import Enum
-from math import pi, tan
-
-from gamemodel import *
-from graphics import *
+from math import cos, pi, sin, tan
+from random import choice, random
+from time import perf_counter
+
+from gamemodel import GRAVITY, X_LOWER, X_UPPER, Game, Projectile
+from graphics import (
+    Circle,
+    Entry,
+    GraphWin,
+    Line,
+    Point,
+    Rectangle,
+    Text,
+    color_rgb,
+    update,
+)
 
 TEXT_Y_OFFSET_FACTOR = 0.7
 TICKS_PER_SECOND = 60
+TICK_TIME = 1.0 / TICKS_PER_SECOND
 TIME_SPEED_FACTOR = 2
 Y_LOWER = -10
 Y_UPPER = 155
@@ -27,8 +40,11 @@ BACKGROUND_LINES_SPACING = (
     WORLD_WIDTH + BACKGROUND_LINES_TOP_OFFSET
 ) / BACKGROUND_LINES_COUNT
 BACKGROUND_LINES_COLOR = "#e3f8fc"
+BACKGROUND_LINES_TAG = "stripe"
 BACKGROUND_FILL_COLOR = "white"
 CANNON_OUTLINE_COLOR = "black"
+SCORE_TEXT_CACHE_SIZE = 64
+PARTICLE_COLOR_COUNT = 64
 HIT_PARTICLE_COUNT = 50
 HIT_PARTICLE_MAX_VELOCITY = 10
 HIT_PARTICLE_MAX_HALF_SIZE = 1
@@ -43,6 +59,9 @@ WIND_PARTICLE_MAX_HALF_SIZE = 1
 WIND_PARTICLE_WIND_FACTOR = 50.0
 WIND_PARTICLE_Y_SPREAD_ON_EDGE_HIT = WORLD_HEIGHT * 0.3
 
+# Scores stay small, so their texts are formatted once up front
+SCORE_TEXTS = tuple(f"Score: {score}" for score in range(SCORE_TEXT_CACHE_SIZE))
+
 
 class GameGraphics:
     def __init__(self, game: Game):
@@ -54,7 +73,19 @@ class GameGraphics:
         self.player_size = game.getCannonSize()
         self.player_half_size = self.player_size / 2.0
         self.projectile_radius = game.getProjectileRadius()
-        self.particles: list[tuple[Projectile, Rectangle]] = []
+
+        # Trajectory buffers reused by every shot, grown as needed
+        self.trajectory_xs: list[float] = []
+        self.trajectory_ys: list[float] = []
+
+        # Particles pick their colors from these instead of formatting new ones
+        self.wind_particle_colors = self.generateParticleColors(
+            WIND_PARTICLE_COLOR_FACTORS, True
+        )
+        self.hit_particle_colors = [
+            self.generateParticleColors(HIT_PARTICLE_PLAYER_0_COLOR_FACTORS, False),
+            self.generateParticleColors(HIT_PARTICLE_PLAYER_1_COLOR_FACTORS, False),
+        ]
 
         self.drawFrame()
 
@@ -62,31 +93,39 @@ class GameGraphics:
         self.drawStripedBackground()
         self.drawWindParticles()
         self.drawGround()
-        self.draw_cannons = [self.drawCanon(0), self.drawCanon(1)]
-        self.draw_scores = [self.drawScore(0), self.drawScore(1)]
-        self.draw_projs: list[Circle | None] = [None, None]
-
-    def updateFrame(self) -> None:
-        if self.win.isClosed():
+        # Per-player canvas item ids, updated directly through the canvas
+        # Projectiles are drawn before the scores so they pass behind them
+        self.cannon_ids = [self.drawCanon(0), self.drawCanon(1)]
+        self.proj_ids = [self.drawProjectile(0), self.drawProjectile(1)]
+        self.score_ids = [self.drawScore(0), self.drawScore(1)]
+        self.hit_particles = ParticleSystem(self.win, HIT_PARTICLE_COUNT)
+
+    def updateFrame(self, rate: float = TICKS_PER_SECOND * TIME_SPEED_FACTOR) -> None:
+        # GraphWin's own WM_DELETE_WINDOW handler sets this flag
+        if self.win.closed:
             exit()
 
         self.updateStripedBackground()
-        self.updateParticles()
-        self.updateWindParticles()
-        update(TICKS_PER_SECOND*TIME_SPEED_FACTOR)
+        self.hit_particles.update(TICK_TIME)
+        self.wind_particles.update(TICK_TIME)
+        update(rate)
 
     def updateStripedBackground(self) -> None:
-        for line in self.striped_background_lines:
-            line.move(BACKGROUND_LINES_SPEED / TICKS_PER_SECOND, 0)
-            if line.getP2().getX() > X_UPPER + BACKGROUND_LINES_TOP_OFFSET:
-                line.move(-WORLD_WIDTH - BACKGROUND_LINES_TOP_OFFSET, 0)
+        # The stripes repeat every BACKGROUND_LINES_SPACING, so they all move
+        # as one tagged group and jump back a spacing once they cover one
+        dx = BACKGROUND_LINES_SPEED * TICK_TIME
+        self.striped_background_offset += dx
+        if self.striped_background_offset >= BACKGROUND_LINES_SPACING:
+            self.striped_background_offset -= BACKGROUND_LINES_SPACING
+            dx -= BACKGROUND_LINES_SPACING
+        self.win.move(BACKGROUND_LINES_TAG, dx / self.win.trans.xscale, 0)
 
     def drawStripedBackground(self) -> None:
         background_fill = Rectangle(Point(X_LOWER, Y_LOWER), Point(X_UPPER, Y_UPPER))
         background_fill.setOutline(BACKGROUND_FILL_COLOR)
         background_fill.setFill(BACKGROUND_FILL_COLOR)
         background_fill.draw(self.win)
-        self.striped_background_lines: list[Line] = []
+        self.striped_background_offset = 0.0
         for i in range(BACKGROUND_LINES_COUNT):
             x_pos = X_LOWER - BACKGROUND_LINES_TOP_OFFSET + i * BACKGROUND_LINES_SPACING
             line = Line(
@@ -96,7 +135,7 @@ class GameGraphics:
             line.setWidth(BACKGROUND_LINES_SPACING / 2.0 * WORLD_TO_WIN_X)
             line.setFill(BACKGROUND_LINES_COLOR)
             line.draw(self.win)
-            self.striped_background_lines.append(line)
+            self.win.addtag_withtag(BACKGROUND_LINES_TAG, line.id)
 
     def drawGround(self) -> None:
         line = Rectangle(Point(X_LOWER, Y_LOWER), Point(X_UPPER, 0))
@@ -104,190 +143,174 @@ class GameGraphics:
         line.setFill("pink")
         line.draw(self.win)
 
-    def drawCanon(self, player_nr: int) -> Rectangle:
+    def drawCanon(self, player_nr: int) -> int:
         player = self.game.getPlayer(player_nr)
+        x, y = player.getX(), player.getY()
+        half_size = self.player_half_size
 
-        p1 = Point(
-            player.getX() - self.player_half_size, player.getY() - self.player_half_size
-        )
-        p2 = Point(
-            player.getX() + self.player_half_size, player.getY() + self.player_half_size
-        )
+        p1 = Point(x - half_size, y - half_size)
+        p2 = Point(x + half_size, y + half_size)
 
         rect = Rectangle(p1, p2)
         rect.setFill(player.color)
         rect.setOutline(CANNON_OUTLINE_COLOR)
         rect.draw(self.win)
-        return rect
+        return rect.id
 
-    def generateWindParticlePos(
-        self, initial_spawn: bool = False
-    ) -> tuple[float, float]:
+    def drawProjectile(self, player_nr: int) -> int:
+        # Each player has one projectile circle that is hidden until they fire
+        player = self.game.getPlayer(player_nr)
+        circle = Circle(Point(player.getX(), player.getY()), self.projectile_radius)
+        circle.setFill(player.color)
+        circle.setOutline(player.color)
+        circle.draw(self.win)
+        self.win.itemconfig(circle.id, state="hidden")
+        return circle.id
+
+    def generateWindParticlePos(self) -> tuple[float, float]:
+        # Wind particles start spread over the whole world; after that the
+        # particle system respawns them at the top when they land
         x = (random() - 0.5) * 1 * WORLD_WIDTH
-        y = (
-            random() * WORLD_HEIGHT
-            if initial_spawn
-            else Y_UPPER + WIND_PARTICLE_Y_SPAWN_OFFSET
-        )
+        y = random() * WORLD_HEIGHT
         return x, y
 
+    def generateParticleColors(
+        self, factors: tuple[int, int, int], lighten: bool
+    ) -> list[str]:
+        colors = []
+        for _ in range(PARTICLE_COLOR_COUNT):
+            r, g, b = (round(random() * f) for f in factors)
+            if lighten:
+                r, g, b = 255 - r, 255 - g, 255 - b
+            colors.append(color_rgb(r, g, b))
+        return colors
+
     def drawWindParticles(self) -> None:
-        self.wind_particles: list[tuple[Projectile, Rectangle]] = []
+        self.wind_particles = ParticleSystem(
+            self.win,
+            WIND_PARTICLE_COUNT,
+            self.game.wind * WIND_PARTICLE_WIND_FACTOR,
+            WIND_PARTICLE_DRAG_X,
+            WIND_PARTICLE_DRAG_Y,
+            Y_UPPER + WIND_PARTICLE_Y_SPAWN_OFFSET,
+            WIND_PARTICLE_Y_SPREAD_ON_EDGE_HIT,
+        )
         for _ in range(WIND_PARTICLE_COUNT):
-            x, y = self.generateWindParticlePos(True)
-            p = Projectile(
-                angle=0.0,
-                velocity=0.0,
-                wind=self.game.wind * WIND_PARTICLE_WIND_FACTOR,
-                x_pos=x,
-                y_pos=y,
-                x_lower=X_LOWER,
-                x_upper=X_UPPER,
-            )
-            half_size = random() * WIND_PARTICLE_MAX_HALF_SIZE
-            rect = Rectangle(
-                Point(x - half_size, y - half_size),
-                Point(x + half_size, y + half_size),
+            x, y = self.generateWindParticlePos()
+            self.wind_particles.spawn(
+                x,
+                y,
+                0.0,
+                0.0,
+                random() * WIND_PARTICLE_MAX_HALF_SIZE,
+                choice(self.wind_particle_colors),
             )
-            f = WIND_PARTICLE_COLOR_FACTORS
-            color = color_rgb(
-                255 - round(random() * f[0]),
-                255 - round(random() * f[1]),
-                255 - round(random() * f[2]),
-            )
-            rect.setFill(color)
-            rect.setOutline(color)
-            rect.draw(self.win)
-            self.wind_particles.append((p, rect))
 
     def spawnParticles(self, pos: tuple[float, float]) -> None:
-        for p, r in self.particles:
-            r.undraw()
+        self.hit_particles.clear()
+        self.hit_particles.wind = self.game.wind
 
-        self.particles: list[tuple[Projectile, Rectangle]] = []
+        # The other player to the current is the one getting hit
+        colors = self.hit_particle_colors[self.game.getCurrentPlayerNumber() ^ 1]
+        # Hits happen on the ground, so the burst goes upwards from particles
+        # resting on top of it rather than halfway into it
         for _ in range(HIT_PARTICLE_COUNT):
-            p = Projectile(
-                angle=random() * 360.0,
-                velocity=random() * HIT_PARTICLE_MAX_VELOCITY,
-                wind=self.game.wind,
-                x_pos=pos[0],
-                y_pos=pos[1],
-                x_lower=X_LOWER,
-                x_upper=X_UPPER,
-            )
+            angle = random() * pi
+            velocity = random() * HIT_PARTICLE_MAX_VELOCITY
             half_size = random() * HIT_PARTICLE_MAX_HALF_SIZE
-            rect = Rectangle(
-                Point(pos[0] - half_size, pos[1] - half_size),
-                Point(pos[0] + half_size, pos[1] + half_size),
-            )
-            # Reversed as the other player to the current is the one getting hit
-            f = (
-                HIT_PARTICLE_PLAYER_0_COLOR_FACTORS
-                if self.game.getCurrentPlayerNumber() == 1
-                else HIT_PARTICLE_PLAYER_1_COLOR_FACTORS
-            )
-            color = color_rgb(
-                round(random() * f[0]), round(random() * f[1]), round(random() * f[2])
-            )
-            rect.setFill(color)
-            rect.setOutline(color)
-            rect.draw(self.win)
-            self.particles.append((p, rect))
-
-    def updateParticles(self) -> None:
-        for i, t in enumerate(self.particles):
-            p, rect = t
-            p.update(1.0 / TICKS_PER_SECOND)
-            if p.getY() < 0.0:
-                self.particles.pop(i)
-            else:
-                rect.move(p.xvel / TICKS_PER_SECOND, p.yvel / TICKS_PER_SECOND)
-
-    def updateWindParticles(self) -> None:
-        for t in self.wind_particles:
-            p, rect = t
-            x_old, y_old = p.x_pos, p.y_pos
-            p.update(
-                1.0 / TICKS_PER_SECOND, WIND_PARTICLE_DRAG_X, WIND_PARTICLE_DRAG_Y, True
+            self.hit_particles.spawn(
+                pos[0],
+                pos[1] + half_size,
+                velocity * cos(angle),
+                velocity * sin(angle),
+                half_size,
+                choice(colors),
             )
-            if p.getY() <= 0.0:
-                p.x_pos, p.y_pos = self.generateWindParticlePos()
-            elif p.getX() <= X_LOWER - 2:
-                p.x_pos = X_UPPER + 1
-                p.y_pos += (random() - 0.5) * WIND_PARTICLE_Y_SPREAD_ON_EDGE_HIT
-            elif p.getX() >= X_UPPER + 2:
-                p.x_pos = X_LOWER - 1
-                p.y_pos += (random() - 0.5) * WIND_PARTICLE_Y_SPREAD_ON_EDGE_HIT
-            rect.move(p.x_pos - x_old, p.y_pos - y_old)
 
     def updateWindParticleWindSpeed(self, wind: float) -> None:
-        for p, _ in self.wind_particles:
-            p.wind = wind
+        self.wind_particles.wind = wind
 
     def formatScore(self, score: int) -> str:
+        if 0 <= score < SCORE_TEXT_CACHE_SIZE:
+            return SCORE_TEXTS[score]
         return f"Score: {score}"
 
-    def drawScore(self, player_nr: int) -> Text:
+    def drawScore(self, player_nr: int) -> int:
         player = self.game.getPlayer(player_nr)
         p = Point(
             player.getX(), player.getY() - self.player_size * TEXT_Y_OFFSET_FACTOR
         )
         text = Text(p, self.formatScore(player.getScore()))
         text.draw(self.win)
-        return text
-
-    def redrawScores(self) -> None:
-        self.draw_scores[0].undraw()
-        self.draw_scores[1].undraw()
-        self.draw_scores[0].draw(self.win)
-        self.draw_scores[1].draw(self.win)
+        return text.id
 
     def updateScore(self, player_nr: int) -> None:
         player = self.game.getPlayer(player_nr)
-        self.draw_scores[player_nr].setText(self.formatScore(player.getScore()))
+        self.win.itemconfig(
+            self.score_ids[player_nr], text=self.formatScore(player.getScore())
+        )
 
     def fire(self, angle: float, vel: float) -> Projectile:
         player_nr = self.game.getCurrentPlayerNumber()
         player = self.game.getPlayer(player_nr)
         proj = player.fire(angle, vel)
 
-        circle_x = proj.getX()
-        circle_y = proj.getY()
-
-        old_proj = self.draw_projs[player_nr]
-        if old_proj is not None:
-            old_proj.undraw()
-            self.draw_projs[player_nr] = None
-
-        circle = Circle((Point(circle_x, circle_y)), self.projectile_radius)
-        circle.setFill(player.color)
-        circle.setOutline(player.color)
-        circle.draw(self.win)
-        self.draw_projs[player_nr] = circle
-
-        # Redraw scores to place them in front of ball
-        self.redrawScores()
-
-        while proj.isMoving():
-            proj.update(1.0 / TICKS_PER_SECOND)
-
-            circle.move(proj.getX() - circle_x, proj.getY() - circle_y)
-
-            circle_x = proj.getX()
-            circle_y = proj.getY()
+        circle_id = self.proj_ids[player_nr]
+
+        # Set the circle's canvas coordinates directly in screen space rather
+        # than moving it by deltas through the Circle wrapper
+        trans = self.win.trans
+        x_base, y_base = trans.xbase, trans.ybase
+        x_scale, y_scale = trans.xscale, trans.yscale
+        radius_x = self.projectile_radius / x_scale
+        radius_y = self.projectile_radius / y_scale
+        set_coords = self.win.coords
+
+        # The player's circle is reused: move it back to the cannon and show it
+        x = (proj.x_pos - x_base) / x_scale
+        y = (y_base - proj.y_pos) / y_scale
+        set_coords(circle_id, x - radius_x, y - radius_y, x + radius_x, y + radius_y)
+        self.win.itemconfig(circle_id, state="normal")
+
+        # The whole flight is simulated up front; the loop only animates it
+        xs, ys = self.trajectory_xs, self.trajectory_ys
+        tick_count = proj.simulate(TICK_TIME, xs, ys)
+        update_frame = self.updateFrame
+
+        # Draw whichever tick the shot should have reached by now, so frames
+        # that render late skip ticks instead of slowing the shot down
+        ticks_per_second = TICKS_PER_SECOND * TIME_SPEED_FACTOR
+        last_tick = tick_count - 1
+        tick = -1
+        start = perf_counter()
+        while tick < last_tick:
+            tick = min(int((perf_counter() - start) * ticks_per_second), last_tick)
+            x = (xs[tick] - x_base) / x_scale
+            y = (y_base - ys[tick]) / y_scale
+            set_coords(
+                circle_id, x - radius_x, y - radius_y, x + radius_x, y + radius_y
+            )
 
-            self.updateFrame()
+            update_frame()
 
         return proj
 
     def play(self) -> None:
+        game = self.game
+        inp: InputDialog | None = None
         while True:
-            player = self.game.getCurrentPlayer()
+            player_nr = game.getCurrentPlayerNumber()
+            player = game.getPlayer(player_nr)
+            other = game.getOtherPlayer()
             old_angle, old_vel = player.getAim()
-            wind = self.game.getCurrentWind()
-            self.updateScore(0)
+            wind = game.getCurrentWind()
 
-            inp = InputDialog(self, old_angle, old_vel, wind)
+            # The dialog is created once and only hidden between turns
+            if inp is None:
+                inp = InputDialog(self, old_angle, old_vel, wind)
+            else:
+                inp.setValues(old_angle, old_vel, wind)
+                inp.show()
             action = inp.interact()
 
             angle, vel = None, None
@@ -296,24 +319,178 @@ class GameGraphics:
                     exit()
                 case InteractAction.FIRE:
                     angle, vel = inp.getValues()
-                    inp.close()
+                    inp.hide()
 
-            player_nr = self.game.getCurrentPlayerNumber()
-            player = self.game.getPlayer(player_nr)
-            other = self.game.getOtherPlayer()
             proj = self.fire(angle, vel)
             distance = other.projectileDistance(proj)
 
             if distance == 0.0:
-                self.draw_projs[player_nr].undraw()
+                self.win.itemconfig(self.proj_ids[player_nr], state="hidden")
                 self.spawnParticles((proj.x_pos, proj.y_pos))
 
                 player.increaseScore()
-                self.updateScore(self.game.getCurrentPlayerNumber())
-                self.game.newRound()
-                self.updateWindParticleWindSpeed(self.game.wind)
+                self.updateScore(player_nr)
+                game.newRound()
+                self.updateWindParticleWindSpeed(game.wind)
+
+            game.nextPlayer()
+
+
+class ParticleSystem:
+    # Particles are kept as parallel lists indexed by slot instead of as a
+    # Projectile each, so a frame updates all of them in one loop over plain
+    # floats. With a respawn_y, particles respawn at that height anywhere
+    # across the world when they land, and come back in on the other side,
+    # moved up or down by up to half of wrap_spread, when they leave it.
+    # Without one they are removed when they land and stop at the sides.
+    def __init__(
+        self,
+        win: GraphWin,
+        capacity: int,
+        wind: float = 0.0,
+        drag_x: float = 1.0,
+        drag_y: float = 1.0,
+        respawn_y: float | None = None,
+        wrap_spread: float = 0.0,
+    ):
+        self.win = win
+        self.wind = wind
+        self.drag_x = drag_x
+        self.drag_y = drag_y
+        self.respawn_y = respawn_y
+        self.wrap_spread = wrap_spread
+
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.xvels = [0.0] * capacity
+        self.yvels = [0.0] * capacity
+        self.half_sizes = [0.0] * capacity
+        self.alive = [False] * capacity
+        # Canvas items are created once, hidden, and reused by each spawn
+        self.ids = [
+            win.create_rectangle(0, 0, 0, 0, state="hidden") for _ in range(capacity)
+        ]
+        # Reversed so that pop() hands out the lowest free slot first
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def spawn(
+        self,
+        x: float,
+        y: float,
+        xvel: float,
+        yvel: float,
+        half_size: float,
+        color: str,
+    ) -> None:
+        # Does nothing when every slot is in use
+        if not self.free:
+            return
+        i = self.free.pop()
+
+        half_size /= self.win.trans.xscale
+        screen_x, screen_y = self.win.toScreen(x, y)
+        self.win.coords(
+            self.ids[i],
+            screen_x - half_size,
+            screen_y - half_size,
+            screen_x + half_size,
+            screen_y + half_size,
+        )
+        self.win.itemconfig(self.ids[i], fill=color, outline=color, state="normal")
+
+        self.xs[i] = x
+        self.ys[i] = y
+        self.xvels[i] = xvel
+        self.yvels[i] = yvel
+        self.half_sizes[i] = half_size
+        self.alive[i] = True
+
+    def remove(self, i: int) -> None:
+        self.win.itemconfig(self.ids[i], state="hidden")
+        self.alive[i] = False
+        self.free.append(i)
+
+    def clear(self) -> None:
+        for i, alive in enumerate(self.alive):
+            if alive:
+                self.remove(i)
+
+    def update(self, time: float) -> None:
+        xs = self.xs
+        ys = self.ys
+        xvels = self.xvels
+        yvels = self.yvels
+        half_sizes = self.half_sizes
+        ids = self.ids
+        alive = self.alive
+
+        # Canvas items are placed straight from screen coordinates
+        set_coords = self.win.coords
+        trans = self.win.trans
+        x_base, y_base = trans.xbase, trans.ybase
+        x_scale, y_scale = trans.xscale, trans.yscale
+
+        # Same step as Projectile.update, with everything that is constant
+        # over the frame computed up front
+        xvel_change = self.wind * time
+        yvel_change = GRAVITY * time
+        x_offset = 0.5 * xvel_change
+        y_offset = 0.5 * yvel_change
+        drag_x = self.drag_x
+        drag_y = self.drag_y
+        respawn_y = self.respawn_y
+        wrap = respawn_y is not None
+        wrap_left = X_LOWER - 2
+        wrap_right = X_UPPER + 2
+        spread = self.wrap_spread
+        for i in range(len(xs)):
+            if not alive[i]:
+                continue
 
-            self.game.nextPlayer()
+            xvel = xvels[i]
+            yvel = yvels[i]
+
+            x = xs[i] + time * (xvel + x_offset)
+            y = ys[i] + time * (yvel - y_offset)
+            xvels[i] = (xvel + xvel_change) * drag_x
+            yvels[i] = (yvel - yvel_change) * drag_y
+
+            if wrap:
+                if y <= 0.0:
+                    x = X_LOWER + random() * WORLD_WIDTH
+                    y = respawn_y
+                elif x <= wrap_left:
+                    x = X_UPPER + 1
+                    y += (random() - 0.5) * spread
+                elif x >= wrap_right:
+                    x = X_LOWER - 1
+                    y += (random() - 0.5) * spread
+            else:
+                if y <= 0.0:
+                    # Landed particles are drawn on the ground for a frame and
+                    # removed on the next, so ones spawned there still show
+                    if ys[i] <= 0.0:
+                        self.remove(i)
+                        continue
+                    y = 0.0
+                if x < X_LOWER:
+                    x = X_LOWER
+                elif x > X_UPPER:
+                    x = X_UPPER
+
+            xs[i] = x
+            ys[i] = y
+
+            screen_x = (x - x_base) / x_scale
+            screen_y = (y_base - y) / y_scale
+            half_size = half_sizes[i]
+            set_coords(
+                ids[i],
+                screen_x - half_size,
+                screen_y - half_size,
+                screen_x + half_size,
+                screen_y + half_size,
+            )
 
 
 class InteractAction(Enum):
@@ -331,15 +508,14 @@ class InputDialog:
 
         Text(Point(1, 1), "Angle").draw(win)
         self.angle = Entry(Point(3, 1), 5).draw(win)
-        self.angle.setText(str(angle))
 
         Text(Point(1, 2), "Velocity").draw(win)
         self.vel = Entry(Point(3, 2), 5).draw(win)
-        self.vel.setText(str(vel))
 
         Text(Point(1, 3), "Wind").draw(win)
-        self.height = Text(Point(3, 3), 5).draw(win)
-        self.height.setText("{0:.2f}".format(wind))
+        self.wind_display = Text(Point(3, 3), "").draw(win)
+
+        self.setValues(angle, vel, wind)
 
         self.fire = Button(win, Point(1, 4), 1.25, 0.5, "Fire!", "green")
         self.fire.activate()
@@ -347,26 +523,47 @@ class InputDialog:
         self.quit = Button(win, Point(3, 4), 1.25, 0.5, "Quit", "lightgray")
         self.quit.activate()
 
+        # Clicks are queued by the window's click handler as they come in, in
+        # screen coordinates, so interact() doesn't need checkMouse()
+        self.clicks: list[Point] = []
+        win.setMouseHandler(self.clicks.append)
+
     def interact(self) -> InteractAction:
         while True:
-            self.game_graphics.updateFrame()
+            # Every frame advances the scene by one tick, so while waiting for
+            # input it runs at real time rather than the sped up shot rate
+            self.game_graphics.updateFrame(TICKS_PER_SECOND)
 
-            if self.win.isClosed():
+            if self.win.closed:
                 exit()
 
-            pt = self.win.checkMouse()
-            if pt == None:
-                continue
-            if self.quit.clicked(pt):
-                return InteractAction.QUIT
-            elif self.fire.clicked(pt):
-                return InteractAction.FIRE
+            # Handle every click queued since the last frame, not just one
+            clicks = self.clicks
+            while clicks:
+                click = clicks.pop(0)
+                pt = Point(*self.win.toWorld(click.getX(), click.getY()))
+                if self.quit.clicked(pt):
+                    return InteractAction.QUIT
+                elif self.fire.clicked(pt):
+                    return InteractAction.FIRE
 
     def getValues(self) -> tuple[float, float]:
         a = float(self.angle.getText())
         v = float(self.vel.getText())
         return a, v
 
+    def setValues(self, angle: float, vel: float, wind: float) -> None:
+        self.angle.setText(str(angle))
+        self.vel.setText(str(vel))
+        self.wind_display.setText(f"{wind:.2f}")
+
+    def show(self) -> None:
+        self.clicks.clear()
+        self.win.master.deiconify()
+
+    def hide(self) -> None:
+        self.win.master.withdraw()
+
     def close(self) -> None:
         self.win.close()
 
@@ -384,11 +581,11 @@ class Button:
         w, h = width / 2.0, height / 2.0
         x, y = center.getX(), center.getY()
 
-        self.xmax, self.xmin = x + w, x - w
-        self.ymax, self.ymin = y + h, y - h
+        # (xmin, ymin, xmax, ymax), unpacked in one go by clicked()
+        self.bbox = (x - w, y - h, x + w, y + h)
 
-        p1 = Point(self.xmin, self.ymin)
-        p2 = Point(self.xmax, self.ymax)
+        p1 = Point(self.bbox[0], self.bbox[1])
+        p2 = Point(self.bbox[2], self.bbox[3])
 
         self.rect = Rectangle(p1, p2)
         self.rect.setFill(color)
@@ -400,13 +597,11 @@ class Button:
         self.deactivate()
 
     def clicked(self, p: Point) -> bool:
-        return (
-            self.active
-            and self.xmin <= p.getX() <= self.xmax
-            and self.ymin <= p.getY() <= self.ymax
-        )
+        px, py = p.x, p.y
+        xmin, ymin, xmax, ymax = self.bbox
+        return self.active and xmin <= px <= xmax and ymin <= py <= ymax
 
-    def getLabel(self) -> Text:
+    def getLabel(self) -> str:
         return self.label.getText()
 
     def activate(self) -> None:
@@ -120,6 +120,26 @@ def runTests(game):
     test(ticks == 61, f"Incorrect tick-count, should be {61}, was {ticks}")
     test(abs(proj.getX() - 68.2424059747553) < 0.01, "Projectile X-Position is {0:f}, should be 68.2424059747553".format(proj.getX()))
     
+    # Test simulating whole shots into reused lists. The second shot is longer
+    # than the first, so its lists are too short and have to grow
+    xs = []
+    ys = []
+    for angle, vel in ((60, 20), (45, 41)):
+        stepped = players[0].fire(angle, vel)
+        ticks = 0
+        while stepped.isMoving():
+            stepped.update(1/60)
+            ticks += 1
+            assert ticks <= 1000, "projectile should have stopped now..."
+
+        proj = players[0].fire(angle, vel)
+        count = proj.simulate(1/60, xs, ys)
+        test(count == ticks, f"simulate() should return {ticks} positions, was {count}")
+        test(len(xs) >= count and len(ys) >= count, "simulate() should grow the lists to fit the shot")
+        test(abs(proj.getX() - stepped.getX()) < 0.01, "Simulated X-Position is {0:f}, should be {1:f}".format(proj.getX(), stepped.getX()))
+        test(abs(proj.getY() - stepped.getY()) < 0.01, "Simulated Y-Position is {0:f}, should be {1:f}".format(proj.getY(), stepped.getY()))
+        test(xs[count - 1] == proj.getX() and ys[count - 1] == proj.getY(), "The last simulated position should be where the projectile stopped")
+
     # A few additional hints
     gameAtts = len(game.__dict__.items())
     if (gameAtts > 5):
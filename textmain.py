@@ -60,4 +60,5 @@ def textPlay():
         input()
         print('') # Print an empty line
 
-textPlay()
+if __name__ == "__main__":
+    textPlay()